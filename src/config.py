@@ -1,7 +1,14 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_default=False,
+    )
     
     PROJECT_NAME: str = "Calabi ML Server"
     DEBUG: bool = True
@@ -16,14 +23,37 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = "gpt-4o-mini"#"gpt-4.1-nano"#"gpt-4o-mini"
     OPENROUTER_API_KEY: str | None = None
     OPENROUTER_MODEL: str = "google/gemini-2.0-flash-001"#"google/gemini-2.0-flash-exp:free"
+    OPENROUTER_MAX_CONCURRENCY: int = 8
+    CANON_CACHE_DIR: str = ".canon_cache"
+    # micro-batching window for canonicalization calls; 0 disables coalescing
+    CANON_BATCH_WINDOW_MS: int = 0
+    CANON_MAX_BATCH: int = 8
+    # skip the LLM for uncached plain-ASCII English surfaces and echo them as
+    # their own canonicals; off by default because English canonicalization
+    # is not identity (plural→singular, action phrase→target entity)
+    CANON_EN_TRUST_ASCII: bool = False
 
     # NER
     NER_MAX_MENTIONS: int = 12
+    # exact-hit response cache for /nlp/ner; TTL 0 disables it
+    NER_CACHE_TTL_SEC: float = 300.0
+    NER_CACHE_MAX: int = 4096
     NER_MIN_TOKEN_LEN: int = 2
     NER_REQUEST_TIMEOUT_SEC: float = 8.0
+    # cross-request micro-batching of GLiNER forwards; window 0 disables it
+    NER_BATCH_WINDOW_MS: int = 0
+    NER_MAX_BATCH: int = 32
 
     # GLiNER
     GLINER_MODEL: str = "gliner-community/gliner_large-v2.5"#"urchade/gliner_medium-v2.1"
     GLINER_THRESHOLD: float = 0.1
+    # torch dtype for model weights: "float32", "bfloat16" or "float16"
+    # (half precision roughly halves memory bandwidth per forward)
+    GLINER_DTYPE: str = "float32"
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,10 +1,26 @@
+import hashlib
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import settings
+from src.nlp.openai.prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_VERSION
 from src.nlp.router import router as nlp_router
 
+logging.basicConfig(level=logging.WARNING)
+
+log = logging.getLogger(__name__)
+
 def create_app() -> FastAPI:
+    # logged once per startup so a cache-prefix regression (any byte drift of
+    # the prompt between deploys) is visible; WARNING so the default level
+    # configured above does not swallow it
+    log.warning(
+        "SYSTEM_PROMPT %s sha256=%s",
+        SYSTEM_PROMPT_VERSION,
+        hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest(),
+    )
     app = FastAPI(
         title=settings.PROJECT_NAME,
         debug=settings.DEBUG,
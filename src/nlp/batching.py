@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+from src.config import settings
+
+
+class BatchingNERExecutor:
+    """
+    동시 요청의 GLiNER 추론을 하나의 padded forward로 묶는 실행기.
+
+    run() 코루틴들이 submit()으로 텍스트를 큐에 넣으면, 워커가 첫 항목을
+    집은 뒤 NER_BATCH_WINDOW_MS 동안 추가 항목을 NER_MAX_BATCH까지 모아
+    extract_many 한 번으로 처리하고 Future로 결과를 돌려준다 — 모델
+    오버헤드(토크나이즈/커널 런치)를 동시 사용자 수만큼 분할 상환한다.
+    """
+
+    def __init__(self, engine: Any) -> None:
+        self._engine = engine
+        self._max_batch = max(1, settings.NER_MAX_BATCH)
+        self._window_sec = settings.NER_BATCH_WINDOW_MS / 1000.0
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        # 루프에 묶이므로 첫 submit 시점(루프 위)에서 lazily 시작한다
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, text: str) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        fut: asyncio.Future = loop.create_future()
+        await self._queue.put((text, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # 첫 항목은 무기한 대기, 이후 window가 닫힐 때까지만 더 모은다
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window_sec
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await asyncio.to_thread(self._engine.extract_many, texts)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            for (_, fut), ents in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(ents)
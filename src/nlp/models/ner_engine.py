@@ -1,18 +1,63 @@
 from __future__ import annotations
 
+import logging
+import re
+import sys
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 from src.config import settings
-from ..utils import dedup_by_span, clamp01
-from ..schemas import NERLabel
+from ..utils import clamp01
+from ..schemas import NER_LABELS
 
 try:
     from gliner import GLiNER  # type: ignore
 except Exception:  # pragma: no cover
     GLiNER = None
 
-@dataclass
+log = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\S+")
+
+
+@lru_cache(maxsize=1)
+def _load_gliner(model_name: str, dtype: str) -> Optional["GLiNER"]:
+    # one multi-hundred-MB model per process, shared by every NEREngine
+    if GLiNER is None:
+        return None
+    torch_dtype = None
+    if dtype and dtype != "float32":
+        try:
+            import torch
+
+            torch_dtype = getattr(torch, dtype, None)
+            if torch_dtype is None:
+                log.warning("Unknown GLINER_DTYPE %r; loading in float32", dtype)
+        except Exception:  # pragma: no cover
+            pass
+    if torch_dtype is not None:
+        # half precision must not cost us the model: any failure here falls
+        # through to the plain float32 load below instead of returning None
+        try:
+            model = GLiNER.from_pretrained(model_name)
+            model.model.to(torch_dtype)
+            return model
+        except Exception as e:
+            log.warning(
+                "Failed to load GLiNER model %r as %s (%s); retrying in float32",
+                model_name,
+                dtype,
+                e,
+            )
+    try:
+        return GLiNER.from_pretrained(model_name)
+    except Exception as e:
+        log.warning("Failed to load GLiNER model %r: %s", model_name, e)
+        return None
+
+
+@dataclass(slots=True, frozen=True)
 class RawEntity:
     text: str
     start: int
@@ -21,20 +66,24 @@ class RawEntity:
     score: float
 
 
+def _dedup_entities(ents: List[RawEntity]) -> List[RawEntity]:
+    # keep the best-scoring entity per (start, end) span, output span-sorted
+    out: List[RawEntity] = []
+    seen: set[tuple[int, int]] = set()
+    for e in sorted(ents, key=lambda e: (e.start, e.end, -e.score)):
+        key = (e.start, e.end)
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(e)
+    return out
+
+
 class NEREngine:
     def __init__(self, min_token_len: int) -> None:
         self.min_token_len = min_token_len
-        self._gliner = None
-
-        if GLiNER is not None:
-            try:
-                self._gliner = GLiNER.from_pretrained(settings.GLINER_MODEL)
-            except Exception as e:
-                print(f"Failed to load GLiNER model '{settings.GLINER_MODEL}': {e}")
-                self._gliner = None
-
-        # label set for GLiNER
-        self._labels = list(NERLabel.__args__)
+        self._gliner = _load_gliner(settings.GLINER_MODEL, settings.GLINER_DTYPE)
+        self._labels = NER_LABELS
 
     def extract(self, text: str) -> List[RawEntity]:
         if self._gliner is not None:
@@ -43,54 +92,64 @@ class NEREngine:
                 return ents
         return self._extract_fallback(text)
 
+    def extract_many(self, texts: List[str]) -> List[List[RawEntity]]:
+        """Batch variant: one padded transformer forward for all texts."""
+        if not texts:
+            return []
+        if self._gliner is not None:
+            try:
+                batches = self._gliner.batch_predict_entities(
+                    list(texts),
+                    list(self._labels),
+                    threshold=float(settings.GLINER_THRESHOLD),
+                )
+                out = [self._convert_gliner_preds(preds) for preds in batches]
+                # keep extract()'s fallback semantics per text
+                return [
+                    ents if ents else self._extract_fallback(text)
+                    for text, ents in zip(texts, out)
+                ]
+            except Exception:
+                pass
+        return [self.extract(t) for t in texts]
+
     def _extract_gliner(self, text: str) -> List[RawEntity]:
         preds = self._gliner.predict_entities(
             text,
             self._labels,
             threshold=float(settings.GLINER_THRESHOLD),
         )
+        return self._convert_gliner_preds(preds)
 
+    def _convert_gliner_preds(self, preds: List[dict]) -> List[RawEntity]:
         out: List[RawEntity] = []
+        # local bindings: skip global/attribute lookups inside the per-entity loop
+        append = out.append
+        entity = RawEntity
+        clamp = clamp01
+        intern = sys.intern
         for p in preds:
             try:
-                out.append(
-                    RawEntity(
+                append(
+                    entity(
                         text=str(p["text"]),
                         start=int(p["start"]),
                         end=int(p["end"]),
-                        label=str(p["label"]),
-                        score=clamp01(float(p.get("score", 0.5))),
+                        label=intern(str(p["label"])),
+                        score=clamp(float(p.get("score", 0.5))),
                     )
                 )
             except Exception:
                 continue
 
         # dedup by span (keep best score)
-        as_dict = [
-            {"span": {"start": e.start, "end": e.end}, "score": e.score, "_e": e} for e in out
-        ]
-        deduped = dedup_by_span(as_dict)
-        return [d["_e"] for d in deduped]
+        return _dedup_entities(out)
 
     def _extract_fallback(self, text: str) -> List[RawEntity]:
-        out: List[RawEntity] = []
-        i, n = 0, len(text)
-
-        while i < n:
-            if text[i].isspace():
-                i += 1
-                continue
-
-            j = i
-            while j < n and not text[j].isspace():
-                j += 1
-
-            token = text[i:j].strip()
-            if len(token) >= self.min_token_len:
-                out.append(RawEntity(text=token, start=i, end=j, label="None", score=0.40))
-            i = j
-
+        out = [
+            RawEntity(text=m.group(), start=m.start(), end=m.end(), label="None", score=0.40)
+            for m in _TOKEN_RE.finditer(text)
+            if m.end() - m.start() >= self.min_token_len
+        ]
         # dedup
-        as_dict = [{"span": {"start": e.start, "end": e.end}, "score": e.score, "_e": e} for e in out]
-        deduped = dedup_by_span(as_dict)
-        return [d["_e"] for d in deduped]
+        return _dedup_entities(out)
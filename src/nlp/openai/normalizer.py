@@ -2,22 +2,47 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import logging
+import sys
 from typing import Any, Dict, List, Literal, Optional, Tuple
 
+import httpx
+import orjson
 from cachetools import LRUCache
-from openai import OpenAI
-from pydantic import BaseModel, Field
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from src.config import settings
-from .prompts import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from .prompts import SYSTEM_PROMPT, SYSTEM_PROMPT_VERSION, render_user_prompt
 
+try:
+    from diskcache import Cache as DiskCache  # type: ignore
+except Exception:  # pragma: no cover
+    DiskCache = None
 
+log = logging.getLogger(__name__)
+
+# closed reason set: reuse one interned str per value instead of a fresh
+# allocation per mention
+_REASONS: Dict[str, str] = {
+    k: sys.intern(k) for k in ("abbr_expansion", "normalization", "unchanged", "unknown")
+}
+
+
+# frozen response models: immutability lets pydantic-core skip assignment
+# machinery and makes cached CanonicalizeOut objects safe to share between
+# requests (_RESPONSE_CACHE hands out the same parsed instance)
 class Span(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     start: int = Field(ge=0)
     end: int = Field(ge=0)
 
 
 class OutMention(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     surface: str
     span: Span
 
@@ -27,55 +52,249 @@ class OutMention(BaseModel):
 
 
 class CanonicalizeOut(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     normalized_text_en: str
     mentions: List[OutMention]
 
 
+class CanonicalizeBatchOut(BaseModel):
+    results: List[CanonicalizeOut]
+
+
+# built once; re-creating the adapter per call re-walks pydantic model/schema construction
+_CANON_ADAPTER: TypeAdapter[CanonicalizeOut] = TypeAdapter(CanonicalizeOut)
+_BATCH_ADAPTER: TypeAdapter[CanonicalizeBatchOut] = TypeAdapter(CanonicalizeBatchOut)
+
+# the raw responses.create path has no server-side schema enforcement, so
+# pin the exact output shape by baking the generated JSON schema into the
+# static prompt once at import — prompt and validator stay in lockstep
+_SYSTEM_PROMPT_FULL = sys.intern(
+    SYSTEM_PROMPT
+    + "\n\nOUTPUT JSON SCHEMA (the response MUST validate against this):\n"
+    + orjson.dumps(CanonicalizeOut.model_json_schema(), option=orjson.OPT_SORT_KEYS).decode()
+)
+
+# cache-routing hint: stable per system-prompt version, rolls automatically
+# when the prompt text (or baked schema) changes
+_PROMPT_CACHE_KEY = (
+    f"canon-{SYSTEM_PROMPT_VERSION}-"
+    + hashlib.sha1(_SYSTEM_PROMPT_FULL.encode()).hexdigest()[:16]
+)
+
+_BATCH_SYSTEM_SUFFIX = """\
+
+
+BATCH MODE:
+- The user message contains a JSON ARRAY of independent payloads.
+- Process each payload separately under all rules above.
+- Output ONLY valid JSON of the form {"results": [<one output object per payload, same order>]}.
+"""
+
+
 # cache: (lang, surface) -> (canonical_en, anchor_en, reason)
-_CANON_CACHE: LRUCache = LRUCache(maxsize=2048)
-_client: Optional[OpenAI] = None
+# disk-backed when diskcache is available so warm hits survive restarts.
+# concurrency contract: every access happens on the event-loop thread (the
+# sync-client asyncio.to_thread hop is gone), so the LRUCache fallback needs
+# no lock; diskcache is additionally thread- and process-safe on its own.
+if DiskCache is not None:
+    _CANON_CACHE = DiskCache(settings.CANON_CACHE_DIR)
+else:
+    _CANON_CACHE = LRUCache(maxsize=2048)
+# LRUCache.update is one C-level call for a whole batch of writes; diskcache
+# has no dict-style bulk update, so resolve the strategy once at import
+_CANON_CACHE_UPDATE = getattr(_CANON_CACHE, "update", None)
+_client: Optional[AsyncOpenAI] = None
+_sem: Optional[asyncio.Semaphore] = None
+
+# full-response memo: with temperature=0 identical payloads deterministically
+# produce identical outputs, so repeat requests become a dict lookup
+_RESPONSE_CACHE: LRUCache = LRUCache(maxsize=512)
+
+
+_ENABLED: Optional[bool] = None
 
 
 def _enabled() -> bool:
-    return bool(settings.CANONICALIZATION_ENABLED and settings.OPENAI_API_KEY)
+    # settings are frozen after import, so compute once and reuse
+    global _ENABLED
+    if _ENABLED is None:
+        _ENABLED = bool(settings.CANONICALIZATION_ENABLED and settings.OPENAI_API_KEY)
+    return _ENABLED
 
 
-def _client_get() -> OpenAI:
+def _client_get() -> AsyncOpenAI:
     global _client
     if _client is None:
-        # _client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        _client = OpenAI(
+        # _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        _client = AsyncOpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=settings.OPENROUTER_API_KEY,
+            # HTTP/2 multiplexes concurrent calls over one kept-alive TLS
+            # connection instead of a handshake per request
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            ),
         )
     return _client
 
 
+def _sem_get() -> asyncio.Semaphore:
+    # keep concurrent OpenRouter calls inside rate limits
+    global _sem
+    if _sem is None:
+        _sem = asyncio.Semaphore(settings.OPENROUTER_MAX_CONCURRENCY)
+    return _sem
+
+
+# built once with lowercase keys so _fallback does a single lookup
+_ABBR_MAP: Dict[str, str] = {
+    "mtg": "meeting",
+    "eod": "end of day",
+    "proj": "project",
+}
+
+
 def _fallback(surface: str) -> Tuple[str, str]:
     s = (surface or "").strip()
-    abbr_map = {
-        "mtg": "meeting",
-        "eod": "end of day",
-        "proj": "project",
-    }
-    canon = abbr_map.get(s.lower(), abbr_map.get(s, s))
+    canon = _ABBR_MAP.get(s.lower(), s)
     reason = "abbr_expansion" if canon != s else "unchanged"
     return canon, reason
 
 
-def _call_openai_sync(system_prompt: str, user_prompt: str) -> CanonicalizeOut:
-    client = _client_get()
-    resp = client.responses.parse(
-        # model=settings.OPENAI_MODEL,
-        model=settings.OPENROUTER_MODEL,
-        input=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.0,
-        text_format=CanonicalizeOut,
+def _all_fallback(text: str, lang: str, mentions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    # shared by the disabled and total-failure paths; preallocate + index
+    # assignment instead of append on this (exception-)hot loop
+    out: List[Dict[str, Any]] = [None] * len(mentions)  # type: ignore[list-item]
+    for i, m in enumerate(mentions):
+        surface = str(m.get("surface", "")).strip()
+        span = m.get("span") or {"start": 0, "end": 0}
+        canon, reason = _fallback(surface)
+        out[i] = {
+            "surface": surface,
+            "span": span,
+            "canonical_en": canon,
+            "anchor_en": canon,  # best-effort
+            "reason": reason,
+        }
+    return {"normalized_text_en": text if lang == "en" else "", "mentions": out}
+
+
+def _log_cached_tokens(resp: Any) -> None:
+    # provider prompt-cache hit rate, visible at DEBUG without extra cost
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    usage = getattr(resp, "usage", None)
+    details = getattr(usage, "input_tokens_details", None) or getattr(
+        usage, "prompt_tokens_details", None
     )
-    return resp.output_parsed
+    log.debug(
+        "canonicalize usage: input_tokens=%s cached_tokens=%s",
+        getattr(usage, "input_tokens", None),
+        getattr(details, "cached_tokens", None),
+    )
+
+
+def _strip_code_fence(raw: str) -> str:
+    if raw.startswith("```"):
+        raw = raw.split("\n", 1)[1] if "\n" in raw else ""
+        raw = raw.rsplit("```", 1)[0]
+    return raw
+
+
+async def _call_openai(system_prompt: str, user_prompt: str) -> CanonicalizeOut:
+    client = _client_get()
+    async with _sem_get():
+        # raw create + module-level adapter: the SDK's .parse() rebuilds the
+        # response schema per call, validate_json is pydantic-core's fast path
+        resp = await client.responses.create(
+            # model=settings.OPENAI_MODEL,
+            model=settings.OPENROUTER_MODEL,
+            input=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.0,
+            prompt_cache_key=_PROMPT_CACHE_KEY,
+        )
+    _log_cached_tokens(resp)
+    raw = _strip_code_fence((resp.output_text or "").strip())
+    return _CANON_ADAPTER.validate_json(raw)
+
+
+# coalescer state: payloads from concurrent requests collected inside a small
+# window and sent as one LLM call (CANON_BATCH_WINDOW_MS=0 keeps this off)
+_pending: List[Tuple[str, "asyncio.Future[CanonicalizeOut]"]] = []
+_flush_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _call_openai_batch(payloads: List[str]) -> List[CanonicalizeOut]:
+    client = _client_get()
+    user_prompt = render_user_prompt("[" + ",".join(payloads) + "]")
+    async with _sem_get():
+        resp = await client.responses.create(
+            model=settings.OPENROUTER_MODEL,
+            input=[
+                {"role": "system", "content": _SYSTEM_PROMPT_FULL + _BATCH_SYSTEM_SUFFIX},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=0.0,
+            prompt_cache_key=_PROMPT_CACHE_KEY,
+        )
+    _log_cached_tokens(resp)
+    raw = _strip_code_fence((resp.output_text or "").strip())
+    results = _BATCH_ADAPTER.validate_json(raw).results
+    if len(results) != len(payloads):
+        raise ValueError(f"batch size mismatch: sent {len(payloads)}, got {len(results)}")
+    return results
+
+
+async def _flush_pending() -> None:
+    await asyncio.sleep(settings.CANON_BATCH_WINDOW_MS / 1000.0)
+
+    global _flush_task
+    batch = _pending[: settings.CANON_MAX_BATCH]
+    del _pending[: settings.CANON_MAX_BATCH]
+    if _pending:
+        _flush_task = asyncio.ensure_future(_flush_pending())
+    else:
+        _flush_task = None
+
+    if not batch:
+        return
+
+    payloads = [p for p, _ in batch]
+    try:
+        if len(payloads) == 1:
+            results = [await _call_openai(_SYSTEM_PROMPT_FULL, render_user_prompt(payloads[0]))]
+        else:
+            results = await _call_openai_batch(payloads)
+        for (_, fut), res in zip(batch, results):
+            if not fut.done():
+                fut.set_result(res)
+    except Exception:
+        # batch failure -> retry each caller individually
+        for payload, fut in batch:
+            if fut.done():
+                continue
+            try:
+                fut.set_result(await _call_openai(_SYSTEM_PROMPT_FULL, render_user_prompt(payload)))
+            except Exception as e:
+                fut.set_exception(e)
+
+
+async def _call_openai_coalesced(payload_json: str) -> CanonicalizeOut:
+    if settings.CANON_BATCH_WINDOW_MS <= 0:
+        return await _call_openai(_SYSTEM_PROMPT_FULL, render_user_prompt(payload_json))
+
+    global _flush_task
+    fut: "asyncio.Future[CanonicalizeOut]" = asyncio.get_running_loop().create_future()
+    _pending.append((payload_json, fut))
+    if _flush_task is None:
+        _flush_task = asyncio.ensure_future(_flush_pending())
+    return await fut
 
 
 def _safe_find_span(haystack: str, needle: str) -> Optional[Dict[str, int]]:
@@ -106,88 +325,297 @@ async def canonicalize_with_anchors(
     - never throws (best-effort)
     - preserves input surface/span exactly in output mentions
     """
+    # disabled is the cheapest and (in test configs) most common path: bail
+    # out before any prompt/cache work
+    if not _enabled():
+        return _all_fallback(text, lang, mentions)
+
     if not mentions:
         return {"normalized_text_en": "", "mentions": []}
 
-    # disabled -> fallback only (no anchors guaranteed)
-    if not _enabled():
+    # consult the cache before paying a network round-trip; only cache misses
+    # go into the prompt, shrinking its token count linearly
+    cached: Dict[str, Tuple[str, str, str]] = {}
+    misses: List[Dict[str, Any]] = []
+    for m in mentions:
+        surface = str(m.get("surface", "")).strip()
+        hit = _CANON_CACHE.get((lang, surface))
+        if hit is not None:
+            cached[surface] = hit
+        else:
+            misses.append(m)
+
+    # opt-in only: 영어 canonicalization은 항등이 아니라서 (friends→friend,
+    # "to see wolves"→wolf) ASCII 표면을 그대로 믿으면 canonical 품질이
+    # 떨어진다. 켜더라도 캐시 consult 뒤라 warm 항목은 LLM 검증값이 우선
+    trust_ascii = (
+        settings.CANON_EN_TRUST_ASCII
+        and lang == "en"
+        and all(
+            (s := str(m.get("surface", "")).strip()).isascii()
+            and s.lower() not in _ABBR_MAP
+            for m in misses
+        )
+    )
+    if lang == "en" and (not misses or trust_ascii):
+        # fully warm (or trusted-ASCII misses) and no translation needed
+        # -> skip the API entirely
         out: List[Dict[str, Any]] = []
         for m in mentions:
             surface = str(m.get("surface", "")).strip()
             span = m.get("span") or {"start": 0, "end": 0}
-            canon, reason = _fallback(surface)
+            hit = cached.get(surface)
+            if hit is not None:
+                canon, anchor_en, reason = hit
+            else:
+                canon, reason = _fallback(surface)
+                anchor_en = canon  # best-effort
             out.append(
                 {
                     "surface": surface,
                     "span": span,
                     "canonical_en": canon,
-                    "anchor_en": canon,  # best-effort
+                    "anchor_en": anchor_en,
                     "reason": reason,
                 }
             )
-        return {"normalized_text_en": text if lang == "en" else "", "mentions": out}
+        return {"normalized_text_en": text, "mentions": out}
+
+    # byte-stable mention order: upstream may emit the same mentions in a
+    # different order for equivalent requests, which would change the payload
+    # bytes and miss the provider prompt cache. Sorting here is safe — the
+    # zip/keyed merge below maps results back to the caller's dicts, and the
+    # output loop iterates the original mentions list.
+    misses.sort(
+        key=lambda m: (
+            (m.get("span") or {}).get("start", 0),
+            (m.get("span") or {}).get("end", 0),
+            str(m.get("surface", "")),
+        )
+    )
 
-    payload = {"text": text, "lang": lang, "mentions": mentions}
-    user_prompt = USER_PROMPT_TEMPLATE.format(payload=payload)
+    # real JSON (orjson, C-level) instead of str(dict)'s Python-repr rendering;
+    # sorted keys keep identical inputs byte-identical for provider prompt caching
+    payload_json = orjson.dumps(
+        {"text": text, "lang": lang, "mentions": misses},
+        option=orjson.OPT_SORT_KEYS,
+    ).decode()
     try:
-        parsed: CanonicalizeOut = await asyncio.to_thread(_call_openai_sync, SYSTEM_PROMPT, user_prompt)
+        resp_key = hashlib.blake2b(payload_json.encode(), digest_size=16).digest()
+        parsed: Optional[CanonicalizeOut] = _RESPONSE_CACHE.get(resp_key)
+        if parsed is None:
+            parsed = await _call_openai_coalesced(payload_json)
+            _RESPONSE_CACHE[resp_key] = parsed
         normalized = (parsed.normalized_text_en or "").strip()
 
-        # map by (orig_start, orig_end, surface)
-        idx: Dict[Tuple[int, int, str], OutMention] = {}
-        for om in parsed.mentions:
-            idx[(om.span.start, om.span.end, om.surface)] = om
-
-        out: List[Dict[str, Any]] = []
+        # the model is instructed to preserve mention order and count, so the
+        # common case is a straight zip against the miss list; build the keyed
+        # index only when the response doesn't line up
+        aligned: Optional[Dict[int, OutMention]] = None
+        if len(parsed.mentions) == len(misses):
+            aligned = {}
+            for m, om in zip(misses, parsed.mentions):
+                mspan = m.get("span") or {}
+                if (
+                    om.surface == str(m.get("surface", "")).strip()
+                    and om.span.start == mspan.get("start", 0)
+                    and om.span.end == mspan.get("end", 0)
+                ):
+                    aligned[id(m)] = om
+                else:
+                    aligned = None
+                    break
 
+        idx: Dict[Tuple[int, int, str], OutMention] = {}
+        if aligned is None:
+            # map by (orig_start, orig_end, surface)
+            idx = {(om.span.start, om.span.end, om.surface): om for om in parsed.mentions}
+
+        # one substring scan per distinct anchor, shared across checks below;
+        # "in" short-circuits on first match and skips find()'s index bookkeeping
+        anchor_hit: Dict[str, bool] = {}
+
+        def _anchor_in_normalized(needle: str) -> bool:
+            hit = anchor_hit.get(needle)
+            if hit is None:
+                hit = needle in normalized
+                anchor_hit[needle] = hit
+            return hit
+
+        # resolve each mention into a (surface, span, canon, anchor, reason)
+        # row first; the dicts are then built in one list comprehension and
+        # the cache writes land as a single batched update below
+        rows: List[Tuple[str, Any, str, str, str]] = []
+        new_entries: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
         for m in mentions:
             surface = str(m.get("surface", "")).strip()
             span = m.get("span") or {"start": 0, "end": 0}
-            key = (int(span.get("start", 0)), int(span.get("end", 0)), surface)
 
-            om = idx.get(key)
+            hit = cached.get(surface)
+            if hit is not None:
+                canon, anchor_en, reason = hit
+                if normalized and anchor_en and not _anchor_in_normalized(anchor_en):
+                    anchor_en = ""
+                rows.append((surface, span, canon, anchor_en, reason))
+                continue
+
+            if aligned is not None:
+                om = aligned.get(id(m))
+            else:
+                # spans arrive as validated ints from the NER pass; no re-coercion
+                # or defaulted .get — a malformed span lands in the outer
+                # except and takes the whole-request fallback once
+                om = idx.get((span["start"], span["end"], surface))
             if om is None:
                 canon, reason = _fallback(surface)
                 anchor_en = canon
             else:
                 canon = (om.canonical_en or "").strip() #or surface
                 anchor_en = (om.anchor_en or "").strip() #or canon
-                reason = str(om.reason)
+                reason = _REASONS.get(om.reason, str(om.reason))
 
                 # hard rule: anchor_en must exist in normalized. If not, fallback safely.
                 # if normalized and normalized.find(anchor_en) < 0:
                 #     anchor_en = canon
-                if normalized and anchor_en and normalized.find(anchor_en) < 0:
+                if normalized and anchor_en and not _anchor_in_normalized(anchor_en):
                     anchor_en = ""
 
-            _CANON_CACHE[(lang, surface)] = (canon, anchor_en, reason)
-
-            out.append(
-                {
-                    "surface": surface,
-                    "span": span,
-                    "canonical_en": canon,
-                    "anchor_en": anchor_en,
-                    "reason": reason,
-                }
-            )
+            new_entries[(lang, surface)] = (canon, anchor_en, reason)
+            rows.append((surface, span, canon, anchor_en, reason))
 
+        if new_entries:
+            if _CANON_CACHE_UPDATE is not None:
+                _CANON_CACHE_UPDATE(new_entries)
+            else:
+                for key, value in new_entries.items():
+                    _CANON_CACHE[key] = value
+
+        out = [
+            {
+                "surface": surface,
+                "span": span,
+                "canonical_en": canon,
+                "anchor_en": anchor_en,
+                "reason": reason,
+            }
+            for surface, span, canon, anchor_en, reason in rows
+        ]
         return {"normalized_text_en": normalized, "mentions": out}
 
     except Exception:
         # total failure -> fallback
-        out: List[Dict[str, Any]] = []
-        for m in mentions:
-            surface = str(m.get("surface", "")).strip()
-            span = m.get("span") or {"start": 0, "end": 0}
-            canon, reason = _fallback(surface)
-            out.append(
-                {
-                    "surface": surface,
-                    "span": span,
-                    "canonical_en": canon,
-                    "anchor_en": canon,
-                    "reason": reason,
-                }
+        return _all_fallback(text, lang, mentions)
+
+
+_batch_client: Optional[AsyncOpenAI] = None
+
+
+def _batch_client_get() -> AsyncOpenAI:
+    # the Batch API is an OpenAI-platform feature (50% pricing, separate rate
+    # pool); OpenRouter does not expose it, so this client talks to OpenAI
+    global _batch_client
+    if _batch_client is None:
+        _batch_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _batch_client
+
+
+async def submit_canonicalize_batch(items: List[Dict[str, Any]]) -> str:
+    """
+    Submit a bulk (non-interactive) canonicalization job via the OpenAI
+    Batch API. Billed at half the synchronous price with a 24h completion
+    window; use wait_for_batch() to collect results.
+
+    Input items: [{ "text": str, "lang": str, "mentions": [...] }, ...]
+    Returns the batch id.
+    """
+    lines: List[bytes] = []
+    for i, it in enumerate(items):
+        payload_json = orjson.dumps(
+            {
+                "text": str(it.get("text", "")),
+                "lang": str(it.get("lang", "unknown")),
+                "mentions": it.get("mentions") or [],
+            },
+            option=orjson.OPT_SORT_KEYS,
+        ).decode()
+        body = {
+            "model": settings.OPENAI_MODEL,
+            "input": [
+                {"role": "system", "content": _SYSTEM_PROMPT_FULL},
+                {"role": "user", "content": render_user_prompt(payload_json)},
+            ],
+            "temperature": 0.0,
+        }
+        lines.append(
+            orjson.dumps(
+                {"custom_id": f"canon-{i}", "method": "POST", "url": "/v1/responses", "body": body}
             )
-        return {"normalized_text_en": text if lang == "en" else "", "mentions": out}
+        )
+
+    client = _batch_client_get()
+    batch_file = await client.files.create(
+        file=("canonicalize_batch.jsonl", b"\n".join(lines)),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/responses",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+async def wait_for_batch(
+    batch_id: str,
+    poll_interval_sec: float = 30.0,
+    max_interval_sec: float = 600.0,
+) -> List[Dict[str, Any]]:
+    """Poll a Batch API job with exponential backoff and return its JSONL records."""
+    client = _batch_client_get()
+    interval = poll_interval_sec
+    while True:
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"batch {batch_id} ended with status {batch.status}")
+        await asyncio.sleep(interval)
+        interval = min(interval * 2.0, max_interval_sec)
+
+    content = await client.files.content(batch.output_file_id)
+    return [orjson.loads(line) for line in content.text.splitlines() if line.strip()]
+
+
+async def canonicalize_batch(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch variant of canonicalize_with_anchors.
+
+    Input items:
+      [{ "text": str, "lang": str, "mentions": [...] }, ...]
+
+    All per-item LLM calls are fired concurrently (bounded by
+    OPENROUTER_MAX_CONCURRENCY); one failing item never poisons the batch
+    because canonicalize_with_anchors is already best-effort per item.
+    """
+    if not items:
+        return []
+
+    results = await asyncio.gather(
+        *[
+            canonicalize_with_anchors(
+                text=str(it.get("text", "")),
+                lang=str(it.get("lang", "unknown")),
+                mentions=it.get("mentions") or [],
+            )
+            for it in items
+        ],
+        return_exceptions=True,
+    )
+
+    out: List[Dict[str, Any]] = []
+    for res in results:
+        if isinstance(res, BaseException):
+            out.append({"normalized_text_en": "", "mentions": []})
+        else:
+            out.append(res)
+    return out
@@ -1,4 +1,12 @@
-SYSTEM_PROMPT = """\
+import sys
+from typing import Final
+
+# bump on any semantic change to SYSTEM_PROMPT; gives cache-key rolls a
+# human-readable handle (the content hash alongside it catches silent edits)
+SYSTEM_PROMPT_VERSION: Final[str] = "v1"
+
+# interned: one shared str object, O(1) identity comparison for cache keys
+SYSTEM_PROMPT: Final[str] = sys.intern("""\
 You are a STRICT Wikidata canonicalization engine.
 You do NOT freely paraphrase or summarize.
 You output machine-consumable canonical keys and anchors.
@@ -138,10 +146,6 @@ STRICTLY FORBIDDEN:
 - Collapsing an activity into a generic event.
 - Omitting an activity because it is "implied" by another word.
 
-STRICTLY FORBIDDEN:
-- Collapsing an activity into a generic event.
-- Omitting an activity because it is "implied" by another word.
-
 Example (FORBIDDEN - MISSING TOKEN):
 - Input Mentions: ["swimming", "friends"]
 - normalized_text_en: "Water activity with people" (BAD: specific tokens "swimming" and "friends" are missing)
@@ -157,22 +161,16 @@ Example (REQUIRED):
 - "친구들과 주말 수영"
   → e.g., "Swimming with friends on the weekend"
 
-FINAL OUTPUT:
-- Output ONLY valid JSON.
-- No explanations. No commentary.
-"""
-
-USER_PROMPT_TEMPLATE = """\
-You will be given a JSON payload with:
-- text: original user input
-- lang: detected language (ko/en/unknown)
-- mentions: list of mentions with fields surface and span
-
-Return a JSON object that EXACTLY matches the output schema.
+USER MESSAGE FORMAT:
+- The user message contains ONLY a JSON payload with:
+  - text: original user input
+  - lang: detected language (ko/en/unknown)
+  - mentions: list of mentions with fields surface and span
+- Return a JSON object that EXACTLY matches the output schema.
 
 CRITICAL EXAMPLES (DO NOT VIOLATE):
 
-1) Common noun plural → singular:
+1) Common noun plural -> singular:
    surface: "friends"
    anchor_en: "friends"
    canonical_en: "friend"
@@ -185,7 +183,7 @@ CRITICAL EXAMPLES (DO NOT VIOLATE):
    surface: "camping" (activity)
    canonical_en: "camping"
 
-4) Action phrase → target entity:
+4) Action phrase -> target entity:
    surface: "to see wolves"
    anchor_en: "to see wolves"
    canonical_en: "wolf"
@@ -193,6 +191,14 @@ CRITICAL EXAMPLES (DO NOT VIOLATE):
 5) If no valid Wikidata key exists:
    canonical_en: ""
 
-Payload:
-{payload}
-"""
\ No newline at end of file
+FINAL OUTPUT:
+- Output ONLY valid JSON.
+- No explanations. No commentary.
+""")
+
+
+def render_user_prompt(payload_json: str) -> str:
+    # every instruction and example lives in SYSTEM_PROMPT, so the user
+    # message is the payload verbatim: no templating step exists that could
+    # slip volatile bytes ahead of (or behind) the dynamic content
+    return payload_json
\ No newline at end of file
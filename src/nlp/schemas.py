@@ -1,5 +1,5 @@
-from typing import Any, Literal, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Final, Literal, Optional, get_args
+from pydantic import BaseModel, Field, field_validator
 
 Lang = Literal["ko", "en", "unknown"]
 
@@ -9,6 +9,9 @@ NERLabel = Literal[
     "Date", "None" # "Particle", "Preposition", "Verb", "Adjective", "Adverb", "Conjunction"
 ]
 
+# immutable label tuple shared by every consumer (no per-call list copies)
+NER_LABELS: Final[tuple[str, ...]] = tuple(get_args(NERLabel))
+
 class Span(BaseModel):
     start: int = Field(ge=0)
     end: int = Field(ge=0)
@@ -59,6 +62,21 @@ class SuggestContext(BaseModel):
         description="추가 컨텍스트",
     )
 
+    @field_validator("extra")
+    @classmethod
+    def _normalize_extra(cls, extra: dict[str, Any]) -> dict[str, Any]:
+        # history/popular_tags는 키스트로크마다 hot path에서 isinstance/strip을
+        # 반복하지 않도록 ingress에서 한 번만 정리해 둔다
+        for key, min_len in (("history", 1), ("popular_tags", 2)):
+            raw = extra.get(key)
+            if isinstance(raw, (list, tuple)):
+                extra[key] = tuple(
+                    stripped
+                    for v in raw
+                    if isinstance(v, str) and len(stripped := v.strip()) >= min_len
+                )
+        return extra
+
 class SuggestItem(BaseModel):
     type: Literal["completion", "tag", "entity"]
     text: str
@@ -1,6 +1,17 @@
+import asyncio
+import bisect
+import hashlib
+import heapq
+import logging
+import re
+import time
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Dict, List, Sequence, Optional, Tuple
 
+from cachetools import TTLCache
 from langdetect import detect
 
 from src.config import settings
@@ -12,11 +23,59 @@ from . import constants
 from .exceptions import NERError, SuggestionError
 from .schemas import Entity, SuggestItem
 from .dtos import SuggestRequest
-from .utils import simple_tokenize
+from .batching import BatchingNERExecutor
+from .trie import build_history_trie
+from .utils import simple_tokenize, simple_tokenize_cached
+
+log = logging.getLogger(__name__)
+
+try:
+    # langdetect의 기본 팩토리는 55개 언어 프로파일을 전부 로드한다 (~45MB
+    # RSS + 후보가 많을수록 판별도 느리다). 이 서비스는 ko/en만 분기하므로
+    # 두 프로파일만 읽는 전용 팩토리를 쓴다 — 다른 언어 입력은 둘 중 가까운
+    # 쪽으로 떨어지는데, lang은 LLM payload 힌트일 뿐이라 무해하다.
+    import json as _json
+    import os as _os
+
+    from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+    from langdetect.utils.lang_profile import LangProfile
+
+    _DETECTOR_FACTORY = DetectorFactory()
+    _DETECT_LANGS = ("en", "ko")
+    for _index, _lang in enumerate(_DETECT_LANGS):
+        with open(
+            _os.path.join(PROFILES_DIRECTORY, _lang), encoding="utf-8"
+        ) as _f:
+            _DETECTOR_FACTORY.add_profile(
+                LangProfile(**_json.load(_f)), _index, len(_DETECT_LANGS)
+            )
+
+    def _detect(text: str) -> str:
+        detector = _DETECTOR_FACTORY.create()
+        detector.append(text)
+        return detector.detect()
+
+except Exception:  # pragma: no cover
+    _detect = detect
 
+_WS_RE = re.compile(r"\s+")
 
+
+@lru_cache(maxsize=4096)
 def _normalize_text(text: str) -> str:
-    return " ".join(text.split()).strip().lower()
+    # 한 번의 sub로 공백 접기 (split+join의 리스트/중간 문자열 할당 제거);
+    # dedup 루프에서 같은 surface가 반복 등장해 memoize 효율이 높다.
+    # casefold는 lower보다 유니코드 동등성 판정이 정확하다 (dedup 키 용도)
+    return _WS_RE.sub(" ", text).strip().casefold()
+
+
+@lru_cache(maxsize=4096)
+def _preprocess_history(history: tuple[str, ...]) -> tuple[str, ...]:
+    """history 문구들의 stripped 형태. 동일 history 튜플이 요청마다 반복
+    전달되므로 정리를 한 번만 치르고 재사용한다 (빈 문구는 제외)."""
+    return tuple(
+        stripped for phrase in history if (stripped := phrase.strip())
+    )
 
 
 @dataclass(frozen=True)
@@ -36,11 +95,13 @@ class CursorContext:
         return not self.fragment
 
 
-def detect_lang(text: str, lang_hint: str | None) -> str:
-    if lang_hint in ("ko", "en"):
-        return lang_hint
+@lru_cache(maxsize=4096)
+def _detect_lang_cached(text_prefix: str) -> str:
+    # langdetect는 호출마다 확률 모델을 다시 돌려 느리다; 키스트로크 단위로
+    # 같은 텍스트가 반복되므로 앞 256자만 키로 memoize (캐시 부수 효과로
+    # langdetect의 비결정성도 같은 입력에 대해선 사라진다)
     try:
-        lang = detect(text)
+        lang = _detect(text_prefix)
         if lang.startswith("ko"):
             return "ko"
         if lang.startswith("en"):
@@ -50,6 +111,12 @@ def detect_lang(text: str, lang_hint: str | None) -> str:
         return "unknown"
 
 
+def detect_lang(text: str, lang_hint: str | None) -> str:
+    if lang_hint in ("ko", "en"):
+        return lang_hint
+    return _detect_lang_cached(text[:256])
+
+
 def _overlap(a: Tuple[int, int], b: Tuple[int, int]) -> int:
     return max(0, min(a[1], b[1]) - max(a[0], b[0]))
 
@@ -58,7 +125,10 @@ def _span_len(s: Tuple[int, int]) -> int:
     return max(0, s[1] - s[0])
 
 
+@lru_cache(maxsize=2048)
 def _find_first_span(haystack: str, needle: str) -> Optional[Tuple[int, int]]:
+    # run() 한 번에 멘션 수만큼 같은 normalized_text_en을 재스캔하므로
+    # (haystack, needle) 단위로 memoize — 반복 anchor는 dict 조회로 끝난다
     if not haystack or not needle:
         return None
     idx = haystack.find(needle)
@@ -83,20 +153,17 @@ def _match_en_entity_by_anchor(
     if anchor_en:
         span = _find_first_span(normalized_text_en, anchor_en)
         if span:
-            a = span
+            # anchor 쪽 값과 분모는 루프 밖에서 한 번만; en_entities는 run()이
+            # 이미 int/float로 채워 넣으므로 원소별 재캐스팅도 불필요
+            a_start, a_end = span
+            denom = max(1, a_end - a_start)
             best = None
             best_score = 0.0
             for e in en_entities:
-                try:
-                    es = (int(e["start"]), int(e["end"]))
-                except Exception:
-                    continue
-                ov = _overlap(a, es)
+                ov = min(a_end, e["end"]) - max(a_start, e["start"])
                 if ov <= 0:
                     continue
-                coverage = ov / max(1, _span_len(a))
-                conf = float(e.get("confidence", 0.0))
-                score = 0.7 * coverage + 0.3 * conf
+                score = 0.7 * (ov / denom) + 0.3 * e.get("confidence", 0.0)
                 if score > best_score:
                     best_score = score
                     best = e
@@ -127,18 +194,69 @@ def override_label(
 class NERService:
     def __init__(self) -> None:
         self.engine = NEREngine(min_token_len=settings.NER_MIN_TOKEN_LEN)
+        # 동시 요청의 GLiNER forward를 한 배치로 묶는다 (window 0이면 미사용)
+        self._batcher = BatchingNERExecutor(self.engine)
+        # L1 exact-hit response cache: repeat titles ("회의 정리" 등) skip the
+        # whole NER + canonicalization pipeline within the TTL
+        self._cache: TTLCache = TTLCache(
+            maxsize=settings.NER_CACHE_MAX, ttl=settings.NER_CACHE_TTL_SEC
+        )
 
-    async def run(self, text: str, lang_hint: str | None) -> Dict[str, Any]:
-        import time
+    @staticmethod
+    def _cache_key(text: str, lang_hint: str | None) -> str:
+        return hashlib.sha256(
+            f"{lang_hint or ''}\x00{_normalize_text(text)}".encode()
+        ).hexdigest()
+
+    async def _extract_async(self, text: str) -> List[Any]:
+        # GLiNER 추론은 CPU-bound: 배치 워커 또는 워커 스레드로 보내
+        # 이벤트 루프가 다른 요청을 계속 처리하게 한다
+        if settings.NER_BATCH_WINDOW_MS > 0:
+            return await self._batcher.submit(text)
+        return await asyncio.to_thread(self.engine.extract, text)
+
+    def extract_entities(self, text: str) -> List[Entity]:
+        """
+        /suggest용 경량 동기 추출 (LLM/GLiNER 미사용).
+
+        토큰들을 하나의 alternation 정규식으로 묶어 원문을 한 번만 스캔한다
+        — 토큰마다 str.find로 재스캔하는 방식의 O(T·L) 대신 O(L + M).
+        """
+        tokens = {
+            t for t in simple_tokenize(text) if len(t) >= settings.NER_MIN_TOKEN_LEN
+        }
+        if not tokens:
+            return []
+        # 긴 토큰 우선: alternation은 왼쪽 우선이라 접두어가 긴 토큰을 가리지 않게
+        pattern = re.compile(
+            "|".join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+        )
+        # finditer는 start 오름차순으로 순회한다
+        return [
+            Entity(
+                text=m.group(),
+                label=constants.DEFAULT_ENTITY_LABEL,
+                start=m.start(),
+                end=m.end(),
+            )
+            for m in pattern.finditer(text)
+        ]
 
-        full_start_time = time.time()
-        print("NERService.run started at", full_start_time)
+    async def run(self, text: str, lang_hint: str | None) -> Dict[str, Any]:
+        cache_key = None
+        if settings.NER_CACHE_TTL_SEC > 0:
+            cache_key = self._cache_key(text, lang_hint)
+            hit = self._cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        full_start_time = time.perf_counter()
         errors: List[Dict[str, Any]] = []
         lang = detect_lang(text, lang_hint)
 
         # ---- Pass 1: span candidates on original text (label is just a hint) ----
         try:
-            raw_entities = self.engine.extract(text)
+            raw_entities = await self._extract_async(text)
         except Exception as e:
             raw_entities = []
             errors.append({"stage": "ner_pass1", "message": str(e)})
@@ -158,8 +276,7 @@ class NERService:
                 }
             )
         # ---- Pass 2: GPT produces (normalized_text_en + canonical_en + anchor_en) ----
-        start_time = time.time()
-        print("Starting canonicalization at", start_time)
+        start_time = time.perf_counter()
         try:
             canon_out = await canonicalize_with_anchors(
                 text=text,
@@ -169,9 +286,7 @@ class NERService:
         except Exception as e:
             canon_out = {"normalized_text_en": "", "mentions": []}
             errors.append({"stage": "canonicalize", "message": str(e)})
-        end_time = time.time()
-        print("Finished canonicalization at", end_time, "took", end_time - start_time, "seconds")
-        print("Canonicalization output:", canon_out)
+        log.debug("canonicalization took %.3fs", time.perf_counter() - start_time)
         normalized_text_en = str(canon_out.get("normalized_text_en", "")).strip() or None
         # mentions 정렬은 (start,end,surface) 키로 매칭
         canon_index: Dict[tuple[int, int, str], Dict[str, Any]] = {}
@@ -186,7 +301,7 @@ class NERService:
         en_entities: List[Dict[str, Any]] = []
         if normalized_text_en:
             try:
-                en_raw = self.engine.extract(normalized_text_en)
+                en_raw = await self._extract_async(normalized_text_en)
                 for e in en_raw:
                     en_entities.append(
                         {
@@ -200,8 +315,9 @@ class NERService:
             except Exception as e:
                 errors.append({"stage": "ner_pass3_en", "message": str(e)})
 
-        mentions: List[Dict[str, Any]] = []
-        seen_surface_label: set[tuple[str, str]] = set()
+        pending: List[Dict[str, Any]] = []
+        reinfer_texts: List[str] = []
+        reinfer_recs: List[Dict[str, Any]] = []
         for m in base_mentions:
             k = (int(m["span"]["start"]), int(m["span"]["end"]), str(m["surface"]))
             cm = canon_index.get(k)
@@ -229,26 +345,42 @@ class NERService:
                     anchor_en=anchor_en,
                 )
 
-            # --- [변경] Fallback 시 개별 단어 재추론 로직 추가 ---
+            rec = {
+                "m": m,
+                "canon_en": canon_en,
+                "reason": reason,
+                "matched": matched,
+                "label": base_label,
+                "conf": base_conf,
+            }
+            # anchor 매칭도 안 되고 1차 NER도 None인 멘션은 단어 단위 재추론
+            # 대상으로 모아 둔다 (멘션마다 forward를 도는 대신 한 배치로)
             if not matched and base_label == "None":
-                print("No anchor match and base label is None, trying single-word re-inference for surface:", m["surface"], "canon_en:", canon_en)
-                # anchor 매칭도 안 되고, 1차 NER도 None인 경우 -> 단어 단위로 다시 추론
-                try:
-                    # GLiNER는 문맥 없이 단어만 넣어도 추론 가능
-                    # extract() 결과 리스트 중 가장 score 높은 것 채택
-                    single_preds = self.engine.extract(canon_en)#m["surface"])
-                    if single_preds:
-                        # score순 정렬되어 있다고 가정하거나 max score 찾기
-                        best_p = max(single_preds, key=lambda x: x.score)
-                        # 임계값(0.3 등) 이상일 때만 덮어쓰기
-                        if best_p.score > 0.3: 
-                            base_label = str(best_p.label)
-                            base_conf = clamp01(float(best_p.score))
-                except Exception:
-                    pass
-            # ----------------------------------------------------
-
-            final_label, final_conf = override_label(base_label, base_conf, matched)
+                reinfer_texts.append(canon_en)
+                reinfer_recs.append(rec)
+            pending.append(rec)
+
+        # --- Fallback 재추론: 모든 대상 단어를 padded forward 한 번으로 ---
+        if reinfer_texts:
+            try:
+                # GLiNER는 문맥 없이 단어만 넣어도 추론 가능
+                batched = await asyncio.to_thread(self.engine.extract_many, reinfer_texts)
+                for rec, single_preds in zip(reinfer_recs, batched):
+                    if not single_preds:
+                        continue
+                    best_p = max(single_preds, key=lambda x: x.score)
+                    # 임계값(0.3 등) 이상일 때만 덮어쓰기
+                    if best_p.score > 0.3:
+                        rec["label"] = str(best_p.label)
+                        rec["conf"] = clamp01(float(best_p.score))
+            except Exception:
+                pass
+
+        mentions: List[Dict[str, Any]] = []
+        seen_surface_label: set[tuple[str, str]] = set()
+        for rec in pending:
+            m = rec["m"]
+            final_label, final_conf = override_label(rec["label"], rec["conf"], rec["matched"])
 
             dedup_key = (m["surface"], final_label)
             if dedup_key in seen_surface_label:
@@ -260,22 +392,25 @@ class NERService:
                     "surface": m["surface"],
                     "span": m["span"],
                     "ner": {"label": final_label, "confidence": clamp01(final_conf)},
-                    "canonical": {"en": str(canon_en), "reason": str(reason)},
+                    "canonical": {"en": str(rec["canon_en"]), "reason": str(rec["reason"])},
                 }
             )
 
-        full_end_time = time.time()
-        print("NERService.run finished at", full_end_time, "took", full_end_time - full_start_time, "seconds")
-        return {
+        log.debug("run took %.3fs", time.perf_counter() - full_start_time)
+        out = {
             "text": text,
             "lang": lang,
             "normalized_text_en": normalized_text_en,
             "mentions": mentions,
             "errors": errors,
         }
+        # only clean results are cached; a degraded run (stage errors) should
+        # retry instead of pinning the failure for the TTL
+        if cache_key is not None and not errors:
+            self._cache[cache_key] = out
+        return out
 
 
-@dataclass
 class SuggestionService:
     """
     Calabi용 용어/문구 추천 엔진 (MVP).
@@ -284,9 +419,15 @@ class SuggestionService:
       1) history(과거 이벤트 제목들)를 활용한 prefix 기반 completion
       2) generic한 suffix(회의/정리/리뷰) completion
       3) NER 엔티티 및 인기 태그 기반 tag 추천
+
+    상태가 전혀 없어 모든 메서드는 staticmethod다 (self 바인딩 비용 제거);
+    router와의 호환을 위해 모듈 싱글턴 인스턴스는 그대로 둔다.
     """
 
-    def _history_completions(self, text: str, history: Sequence[str]) -> list[SuggestItem]:
+    @staticmethod
+    def _history_completions(
+        text: str, history_pre: tuple[str, ...]
+    ) -> list[SuggestItem]:
         text_norm = text.strip().lower()
         if not text_norm:
             return []
@@ -294,27 +435,29 @@ class SuggestionService:
         seen: set[str] = set()
         completions: list[SuggestItem] = []
 
-        for phrase in history:
-            phrase_stripped = phrase.strip()
-            if not phrase_stripped:
+        # trie descent + subtree walk instead of startswith over every phrase
+        trie = build_history_trie(history_pre)
+        for phrase_stripped in trie.iter_phrases(text_norm):
+            if phrase_stripped.lower() == text_norm:
                 continue
-
-            phrase_norm = phrase_stripped.lower()
-            if phrase_norm.startswith(text_norm) and phrase_norm != text_norm:
-                if phrase_stripped in seen:
-                    continue
-                seen.add(phrase_stripped)
-                completions.append(
-                    SuggestItem(
-                        type="completion",
-                        text=phrase_stripped,
-                        score=constants.SCORE_COMPLETION_HISTORY,
-                    )
+            if phrase_stripped in seen:
+                continue
+            seen.add(phrase_stripped)
+            completions.append(
+                SuggestItem(
+                    type="completion",
+                    text=phrase_stripped,
+                    score=constants.SCORE_COMPLETION_HISTORY,
                 )
+            )
+            # 랭킹 상한 이상은 어차피 잘려나가므로 서브트리 걷기를 조기 종료
+            if len(completions) >= constants.MAX_SUGGESTIONS:
+                break
 
         return completions
 
-    def _generic_completions(self, text: str) -> list[SuggestItem]:
+    @staticmethod
+    def _generic_completions(text: str) -> list[SuggestItem]:
         base = text.strip()
         if not base:
             return []
@@ -337,7 +480,8 @@ class SuggestionService:
             )
         return items
 
-    def _tag_suggestions(self, entities: list[Entity], popular_tags: Sequence[str]) -> list[SuggestItem]:
+    @staticmethod
+    def _tag_suggestions(entities: list[Entity], popular_tags: Sequence[str]) -> list[SuggestItem]:
         items: list[SuggestItem] = []
         seen: set[str] = set()
 
@@ -367,7 +511,8 @@ class SuggestionService:
 
         return items
 
-    def _cursor_context(self, text: str, cursor: int | None) -> CursorContext:
+    @staticmethod
+    def _cursor_context(text: str, cursor: int | None) -> CursorContext:
         if cursor is None:
             cursor = len(text)
         length = len(text)
@@ -391,8 +536,8 @@ class SuggestionService:
             token_text=token_text,
         )
 
+    @staticmethod
     def _entity_completions_for_active_token(
-        self,
         text: str,
         cursor_ctx: CursorContext,
         entities: Sequence[Entity],
@@ -411,39 +556,56 @@ class SuggestionService:
         seen: set[str] = set()
         items: list[SuggestItem] = []
 
-        def append_candidate(candidate: str, score: float) -> None:
+        # 후보 풀을 (candidate, score)로 먼저 평탄화하고 필터를 한 루프에서
+        # 일괄 적용 — 소스별 클로저 호출과 루프마다 반복되던
+        # token_text.strip().lower() 재계산을 제거
+        pool: list[tuple[str, float]] = [
+            (ent.text, constants.SCORE_COMPLETION_ENTITY_ACTIVE) for ent in entities
+        ]
+        pool.extend(
+            (token, constants.SCORE_COMPLETION_HISTORY_ACTIVE)
+            for token, _freq in history_tokens
+        )
+        pool.extend(
+            (tag, constants.SCORE_COMPLETION_POPULAR_ACTIVE) for tag in popular_tags
+        )
+
+        # 정규화 후보를 (norm, -score)로 정렬해 두면 prefix 매칭이 연속 구간이
+        # 된다: bisect로 하한을 찾고 prefix가 깨질 때까지만 순회 (O(N) 비교
+        # 대신 O(N log N) 정렬 + O(log N + k) 스캔; 같은 norm은 최고 점수가
+        # 먼저 와 seen 중복 제거가 상위 티어를 지킨다)
+        norm_pool: list[tuple[str, float, str]] = []
+        for candidate, score in pool:
             candidate = candidate.strip()
-            if not candidate:
-                return
-            candidate_norm = candidate.lower()
-            if candidate_norm in seen:
-                return
+            if candidate:
+                norm_pool.append((candidate.lower(), -score, candidate))
+        norm_pool.sort()
+
+        token_norm = cursor_ctx.token_text.strip().lower()
+        start = bisect.bisect_left(norm_pool, (fragment_norm,))
+        for candidate_norm, neg_score, candidate in norm_pool[start:]:
             if not candidate_norm.startswith(fragment_norm):
-                return
-            if candidate_norm == fragment_norm and cursor_ctx.token_text.strip().lower() == candidate_norm:
-                return
+                break
+            if candidate_norm in seen:
+                continue
+            if candidate_norm == fragment_norm and token_norm == candidate_norm:
+                continue
             seen.add(candidate_norm)
-            completed = f"{before}{candidate}{after}"
-            items.append(SuggestItem(type="completion", text=completed, score=score))
-
-        for ent in entities:
-            append_candidate(ent.text, constants.SCORE_COMPLETION_ENTITY_ACTIVE)
-
-        for token, _freq in history_tokens:
-            append_candidate(token, constants.SCORE_COMPLETION_HISTORY_ACTIVE)
-
-        for tag in popular_tags:
-            append_candidate(tag, constants.SCORE_COMPLETION_POPULAR_ACTIVE)
+            items.append(
+                SuggestItem(
+                    type="completion", text=f"{before}{candidate}{after}", score=-neg_score
+                )
+            )
 
         return items
 
+    @staticmethod
     def _next_word_recommendations(
-        self,
         text: str,
         cursor_ctx: CursorContext,
         entities: Sequence[Entity],
         popular_tags: Sequence[str],
-        history: Sequence[str],
+        history_pre: tuple[str, ...],
     ) -> list[SuggestItem]:
         if not cursor_ctx.at_token_boundary:
             return []
@@ -451,28 +613,24 @@ class SuggestionService:
         before = text[: cursor_ctx.cursor]
         after = text[cursor_ctx.cursor :]
 
-        def build_base() -> str:
-            if not before:
-                return ""
-            if before[-1].isspace():
-                return before
-            return f"{before} "
+        # base/suffix는 이 호출 동안 불변 — 후보마다 재계산하지 않는다
+        base = "" if not before else (before if before[-1].isspace() else f"{before} ")
+        suffix = f" {after}" if after and not after[0].isspace() else after
 
         def append_candidate(items_list: list[SuggestItem], candidate: str, score: float, seen_texts: set[str]) -> None:
             candidate = candidate.strip()
             if not candidate:
                 return
-            base = build_base()
-            suggestion_text = f"{base}{candidate}"
-            if after and not after[0].isspace():
-                suggestion_text = f"{suggestion_text} {after}"
-            else:
-                suggestion_text = f"{suggestion_text}{after}"
-
-            if suggestion_text in seen_texts:
+            # before/after는 이 호출 동안 불변이라 후보 문자열만으로 중복이
+            # 판정된다 — 문자열 조립은 생존자에 대해서만 수행. 키는 소문자화:
+            # 대소문자만 다른 후보는 먼저 온(우선순위 높은) 표기를 남긴다
+            key = candidate.lower()
+            if key in seen_texts:
                 return
-            seen_texts.add(suggestion_text)
-            items_list.append(SuggestItem(type="completion", text=suggestion_text, score=score))
+            seen_texts.add(key)
+            items_list.append(
+                SuggestItem(type="completion", text=f"{base}{candidate}{suffix}", score=score)
+            )
 
         items: list[SuggestItem] = []
         seen: set[str] = set()
@@ -483,41 +641,58 @@ class SuggestionService:
         for tag in popular_tags:
             append_candidate(items, tag, constants.SCORE_COMPLETION_NEXT_TAG, seen)
 
-        for phrase in history:
-            for token in simple_tokenize(phrase):
+        for stripped in history_pre:
+            for token in simple_tokenize_cached(stripped):
                 append_candidate(items, token, constants.SCORE_COMPLETION_NEXT_HISTORY, seen)
 
         return items
 
-    def _history_token_candidates(self, history: Sequence[str]) -> list[tuple[str, int]]:
-        tokens: dict[str, list[Any]] = {}
-        for phrase in history:
-            for token in simple_tokenize(phrase):
+    @staticmethod
+    def _history_token_candidates(
+        history_pre: tuple[str, ...]
+    ) -> list[tuple[str, int]]:
+        # Counter가 C 레벨에서 증가/정렬(most_common)을 처리; 표기는
+        # 처음 본 casing을 따로 보존한다
+        counts: Counter[str] = Counter()
+        first_case: dict[str, str] = {}
+        for stripped in history_pre:
+            for token in simple_tokenize_cached(stripped):
                 token_clean = token.strip()
                 if len(token_clean) < 2:
                     continue
                 key = token_clean.lower()
-                if key not in tokens:
-                    tokens[key] = [token_clean, 1]
-                else:
-                    tokens[key][1] += 1
-
-        sorted_tokens = sorted(
-            ((value[0], value[1]) for value in tokens.values()),
-            key=lambda pair: pair[1],
-            reverse=True,
-        )
-        return sorted_tokens
-
-    def _popular_tag_candidates(self, popular_tags: Sequence[str]) -> list[str]:
-        return [tag.strip() for tag in popular_tags if isinstance(tag, str) and len(tag.strip()) >= 2]
-
-    def _deduplicate_and_rank(self, suggestions: Sequence[SuggestItem], current_text: str) -> list[SuggestItem]:
-        current_norm = _normalize_text(current_text)
+                counts[key] += 1
+                first_case.setdefault(key, token_clean)
+
+        return [(first_case[key], freq) for key, freq in counts.most_common()]
+
+    @staticmethod
+    def _popular_tag_candidates(popular_tags: Sequence[str]) -> list[str]:
+        # SuggestContext.extra validator가 ingress에서 strip/길이/타입 필터를
+        # 이미 끝냈으므로 여기서는 방어적 재검사를 하지 않는다
+        return list(popular_tags)
+
+    @staticmethod
+    def _deduplicate_and_rank(
+        suggestions: Sequence[SuggestItem],
+        current_text: str,
+        top_k: int | None = None,
+    ) -> list[SuggestItem]:
         best_by_text: dict[str, SuggestItem] = {}
-
+        SuggestionService._fold_best(best_by_text, suggestions, _normalize_text(current_text))
+        return SuggestionService._rank_top(best_by_text, top_k)
+
+    @staticmethod
+    def _fold_best(
+        best_by_text: dict[str, SuggestItem],
+        suggestions: Sequence[SuggestItem],
+        current_norm: str,
+    ) -> None:
+        """생산자 스트림을 정규화 텍스트 키의 max-score dict로 바로 접는다
+        (중간 연결 리스트 없이 생산자별 결과를 제자리 병합)."""
+        norm = _normalize_text  # 루프 내 전역 조회 제거
         for suggestion in suggestions:
-            normalized = _normalize_text(suggestion.text)
+            normalized = norm(suggestion.text)
             if not normalized or normalized == current_norm:
                 continue
 
@@ -525,55 +700,81 @@ class SuggestionService:
             if existing is None or existing.score < suggestion.score:
                 best_by_text[normalized] = suggestion
 
-        ranked = sorted(best_by_text.values(), key=lambda item: item.score, reverse=True)
-        return ranked[: constants.MAX_SUGGESTIONS]
+    @staticmethod
+    def _rank_top(
+        best_by_text: dict[str, SuggestItem], top_k: int | None
+    ) -> list[SuggestItem]:
+        limit = top_k if isinstance(top_k, int) and top_k > 0 else constants.MAX_SUGGESTIONS
+        # bounded heap: O(N log K) vs sorting all N survivors for the top K
+        return heapq.nlargest(limit, best_by_text.values(), key=attrgetter("score"))
 
-    def generate(self, request: SuggestRequest, entities: list[Entity]) -> list[SuggestItem]:
+    @staticmethod
+    def generate(request: SuggestRequest, entities: list[Entity]) -> list[SuggestItem]:
         try:
             text = request.text
             ctx = request.context
 
             history: Sequence[str] = []
             popular_tags: Sequence[str] = []
+            top_k: int | None = None
 
             if ctx is not None and ctx.extra:
                 extra: dict[str, Any] = ctx.extra
                 history = extra.get("history", []) or []
                 popular_tags = extra.get("popular_tags", []) or []
+                top_k = extra.get("top_k")
 
-            cursor_ctx = self._cursor_context(text, ctx.cursor_position if ctx else None)
+            if not text.strip():
+                # 빈 입력: completion 계열은 만들 것이 없으므로 history 토큰화
+                # 같은 전처리를 전부 건너뛰고 태그 추천만 돌려준다
+                tags = SuggestionService._tag_suggestions(
+                    entities, SuggestionService._popular_tag_candidates(popular_tags)
+                )
+                return SuggestionService._deduplicate_and_rank(tags, text, top_k=top_k)
+
+            cursor_ctx = SuggestionService._cursor_context(text, ctx.cursor_position if ctx else None)
 
-            history_tokens = self._history_token_candidates(history)
-            popular_tag_candidates = self._popular_tag_candidates(popular_tags)
+            # 정규화된 history는 여기서 한 번만 만들어 모든 소비자에 전달
+            history_pre = _preprocess_history(tuple(history))
+            history_tokens = SuggestionService._history_token_candidates(history_pre)
+            popular_tag_candidates = SuggestionService._popular_tag_candidates(popular_tags)
 
-            suggestions: list[SuggestItem] = []
+            # 생산자별 리스트를 이어붙였다가 다시 dedup하는 대신, 각 스트림을
+            # 하나의 max-score dict로 바로 접는다
+            best_by_text: dict[str, SuggestItem] = {}
+            current_norm = _normalize_text(text)
+            fold = SuggestionService._fold_best
 
-            suggestions.extend(
-                self._entity_completions_for_active_token(
+            fold(
+                best_by_text,
+                SuggestionService._entity_completions_for_active_token(
                     text,
                     cursor_ctx,
                     entities,
                     history_tokens,
                     popular_tag_candidates,
-                )
+                ),
+                current_norm,
             )
 
-            suggestions.extend(
-                self._next_word_recommendations(
+            fold(
+                best_by_text,
+                SuggestionService._next_word_recommendations(
                     text,
                     cursor_ctx,
                     entities,
                     popular_tag_candidates,
-                    history,
-                )
+                    history_pre,
+                ),
+                current_norm,
             )
 
             prefix_text = text[: cursor_ctx.cursor]
-            suggestions.extend(self._history_completions(prefix_text, history))
-            suggestions.extend(self._generic_completions(prefix_text))
-            suggestions.extend(self._tag_suggestions(entities, popular_tag_candidates))
+            fold(best_by_text, SuggestionService._history_completions(prefix_text, history_pre), current_norm)
+            fold(best_by_text, SuggestionService._generic_completions(prefix_text), current_norm)
+            fold(best_by_text, SuggestionService._tag_suggestions(entities, popular_tag_candidates), current_norm)
 
-            return self._deduplicate_and_rank(suggestions, text)
+            return SuggestionService._rank_top(best_by_text, top_k)
 
         except Exception as exc:  # noqa: BLE001
             raise SuggestionError(str(exc)) from exc
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterator, Sequence
+
+
+class HistoryTrie:
+    """
+    history 문구 prefix 검색용 trie (dict-of-dicts).
+
+    탐색은 O(L + k): prefix 길이 L만큼 내려간 뒤 그 서브트리의 문구 k개만
+    걷는다. 기존 방식(모든 history에 startswith)은 O(H·L)이라 history가
+    커질수록 느려진다.
+    """
+
+    __slots__ = ("_root", "_last_descent")
+
+    # terminal marker; 원본(소문자화 전) 문구들이 여기에 모인다
+    _LEAF = "\x00"
+
+    def __init__(self, phrases: Sequence[str] = ()) -> None:
+        self._root: dict = {}
+        # 직전 성공 descend의 (prefix, node). 타이핑 중에는 새 prefix가 직전
+        # prefix의 확장인 경우가 대부분이라 루트부터 다시 내려가는 대신
+        # 저장된 locus에서 Δ문자만 마저 내려간다. 트라이 인스턴스 자체가
+        # history 튜플별로 캐시되므로 사용자 간 상태가 섞일 일은 없다.
+        self._last_descent: tuple[str, dict] | None = None
+        for phrase in phrases:
+            self.add(phrase)
+
+    def add(self, phrase: str) -> None:
+        stripped = phrase.strip()
+        if not stripped:
+            return
+        node = self._root
+        for ch in stripped.lower():
+            node = node.setdefault(ch, {})
+        node.setdefault(self._LEAF, []).append(stripped)
+
+    def descend(self, prefix: str) -> dict | None:
+        """Return the subtree node for a (lowercased) prefix, or None."""
+        node = self._root
+        rest = prefix
+        last = self._last_descent
+        if last is not None and prefix.startswith(last[0]):
+            node = last[1]
+            rest = prefix[len(last[0]) :]
+        for ch in rest:
+            node = node.get(ch)
+            if node is None:
+                return None
+        # 성공한 경로만 기억한다 (add는 노드를 제자리 수정하므로 계속 유효)
+        self._last_descent = (prefix, node)
+        return node
+
+    def iter_phrases(self, prefix: str) -> Iterator[str]:
+        """Yield every stored phrase whose lowercased form starts with prefix."""
+        node = self.descend(prefix)
+        if node is None:
+            return
+        stack = [node]
+        leaf_key = self._LEAF
+        while stack:
+            cur = stack.pop()
+            phrases = cur.get(leaf_key)
+            if phrases is not None:
+                yield from phrases
+            stack.extend(child for key, child in cur.items() if key != leaf_key)
+
+
+@lru_cache(maxsize=128)
+def build_history_trie(history: tuple[str, ...]) -> HistoryTrie:
+    # history는 요청마다 그대로 반복 전달되는 경우가 대부분이라 동일 튜플이면
+    # 트라이를 재사용한다 (히스토리가 바뀌면 키가 달라져 자연히 재생성)
+    return HistoryTrie(history)
@@ -1,4 +1,5 @@
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Iterable, List, Tuple
 
 
@@ -51,3 +52,10 @@ def simple_tokenize(text: str) -> list[str]:
     나중에 교체
     """
     return text.split()
+
+
+@lru_cache(maxsize=50000)
+def simple_tokenize_cached(text: str) -> tuple[str, ...]:
+    """simple_tokenize의 memoized 변형 (history 문구처럼 같은 입력이 요청마다
+    반복되는 곳용). 캐시 가능하도록 불변 튜플을 돌려준다."""
+    return tuple(text.split())